@@ -1,118 +1,547 @@
-import os
-import ast
-import json
-import importlib.util
-import sys
-from typing import Dict, Any, List
-
-class PythonProjectParser:
-    def __init__(self, project_path: str):
-      
-        self.project_path = os.path.abspath(project_path)
-        self.project_structure: Dict[str, Any] = {}
-        sys.path.insert(0, self.project_path)
-    
-    def _is_python_file(self, filename: str) -> bool:
-        return filename.endswith('.py') and not filename.startswith('__')
-    
-    def _extract_dependencies(self, node: ast.AST) -> List[str]:
-        dependencies = []
-        for child in ast.iter_child_nodes(node):
-            if isinstance(child, ast.Import):
-                dependencies.extend([alias.name for alias in child.names])
-            elif isinstance(child, ast.ImportFrom):
-                module = child.module or ''
-                dependencies.extend([f"{module}.{alias.name}" for alias in child.names])
-        return dependencies
-    
-    def _parse_function(self, func_node: ast.FunctionDef) -> Dict[str, Any]:
-        variables = {}
-        for child in ast.iter_child_nodes(func_node):
-            if isinstance(child, ast.Assign):
-                for target in child.targets:
-                    if isinstance(target, ast.Name):
-                        variables[target.id] = ast.unparse(child.value).strip()
-        
-        return {
-            'name': func_node.name,
-            'variables': variables,
-            'dependencies': self._extract_dependencies(func_node),
-            'line_number': func_node.lineno
-        }
-    
-    def _parse_class(self, class_node: ast.ClassDef) -> Dict[str, Any]:
-        methods = {}
-        class_variables = {}
-        
-        for child in ast.iter_child_nodes(class_node):
-            if isinstance(child, ast.FunctionDef):
-                methods[child.name] = self._parse_function(child)
-            elif isinstance(child, ast.Assign):
-                for target in child.targets:
-                    if isinstance(target, ast.Name):
-                        class_variables[target.id] = ast.unparse(child.value).strip()
-        
-        return {
-            'name': class_node.name,
-            'methods': methods,
-            'variables': class_variables,
-            'dependencies': self._extract_dependencies(class_node),
-            'line_number': class_node.lineno
-        }
-    
-    def parse_file(self, file_path: str) -> Dict[str, Any]:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            tree = ast.parse(file.read())
-        
-        file_structure = {
-            'functions': {},
-            'classes': {},
-            'dependencies': self._extract_dependencies(tree)
-        }
-        
-        for node in ast.iter_child_nodes(tree):
-            if isinstance(node, ast.FunctionDef):
-                func_info = self._parse_function(node)
-                file_structure['functions'][func_info['name']] = func_info
-            
-            if isinstance(node, ast.ClassDef):
-                class_info = self._parse_class(node)
-                file_structure['classes'][class_info['name']] = class_info
-        
-        return file_structure
-    
-    def parse_project(self) -> Dict[str, Any]:
-        for root, _, files in os.walk(self.project_path):
-            module_name = os.path.relpath(root, self.project_path).replace(os.path.sep, '.')
-            
-            for file in files:
-                if self._is_python_file(file):
-                    file_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(file_path, self.project_path)
-                    if module_name not in self.project_structure:
-                        self.project_structure[module_name] = {}
-                    self.project_structure[module_name][file] = self.parse_file(file_path)
-        
-        return self.project_structure
-    
-    def save_to_json(self, output_path: str = 'project_ast.json'):
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.project_structure, f, indent=2)
-
-def main(project_path: str, output_path: str = 'project_ast.json'):
- 
-    parser = PythonProjectParser(project_path)
-    parser.parse_project()
-    parser.save_to_json(output_path)
-    print(f"Project AST parsed and saved to {output_path}")
-
-if __name__ == "__main__":
-    import sys
-    if len(sys.argv) < 2:
-        print("Usage: python script.py <project_path> [output_path]")
-        sys.exit(1)
-    
-    project_path = sys.argv[1]
-    output_path = sys.argv[2] if len(sys.argv) > 2 else 'project_ast.json'
-    main(project_path, output_path)
+import os
+import ast
+import json
+import hashlib
+import mmap
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, asdict, is_dataclass
+from typing import Dict, Any, Callable, Deque, Generator, Iterator, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack  # type: ignore[import-not-found]
+except ImportError:
+    msgpack = None
+
+CACHE_VERSION = 6
+READ_CHUNK_SIZE = 64 * 1024
+MMAP_THRESHOLD = 1024 * 1024
+READ_WORKERS = 8
+READ_AHEAD = 32
+PROCESS_POOL_MIN_FILES = 64
+SOURCE_MEMO_SIZE = 4096
+
+Source = Union[bytes, mmap.mmap]
+Prefetched = Tuple[str, int, int, Optional[Source], Optional[bytes]]
+
+@dataclass(slots=True)
+class FunctionInfo:
+    name: str
+    variables: Dict[str, str]
+    dependencies: List[str]
+    line_number: int
+
+@dataclass(slots=True)
+class ClassInfo:
+    name: str
+    methods: Dict[str, FunctionInfo]
+    variables: Dict[str, str]
+    dependencies: List[str]
+    line_number: int
+
+class PythonProjectParser:
+    def __init__(self, project_path: str, cache_dir: Optional[str] = None):
+      
+        self.project_path = os.path.abspath(project_path)
+        self.project_structure: Dict[str, Any] = {}
+        self.cache_dir = os.path.abspath(cache_dir or _default_cache_dir())
+        self._prefetched: Dict[str, Source] = {}
+        self._file_memo: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        self._source_memo: Dict[bytes, Dict[str, Any]] = {}
+        self._top_dispatch: Dict[type, Callable[[Any, Dict[str, Any], List[bytes]], None]] = {
+            ast.FunctionDef: self._add_function,
+            ast.ClassDef: self._add_class,
+            ast.Import: self._add_import,
+            ast.ImportFrom: self._add_import_from
+        }
+        self._cache_prefix = f"v{CACHE_VERSION}-py{'.'.join(map(str, sys.version_info[:3]))}-"
+    
+    def _iter_py_files(self, root: str, module_name: str = '.') -> Iterator[Tuple[str, str, str]]:
+        subdirs = []
+        try:
+            entries = os.scandir(root)
+        except OSError:
+            return
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, name))
+                elif name.endswith('.py') and name[:2] != '__' and entry.is_file():
+                    yield module_name, name, entry.path
+        for subdir, name in subdirs:
+            yield from self._iter_py_files(subdir, name if module_name == '.' else module_name + '.' + name)
+    
+    def _source_segment(self, source_lines: List[bytes], node: ast.expr) -> str:
+        start, end = node.lineno - 1, (node.end_lineno or node.lineno) - 1
+        if start == end:
+            segment = source_lines[start][node.col_offset:node.end_col_offset]
+        else:
+            segment = b''.join([source_lines[start][node.col_offset:],
+                                *source_lines[start + 1:end],
+                                source_lines[end][:node.end_col_offset]])
+            segment = segment.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        return segment.decode('utf-8')
+    
+    def _parse_function(self, func_node: ast.FunctionDef, source_lines: List[bytes]) -> FunctionInfo:
+        _Assign = ast.Assign; _Import = ast.Import; _ImportFrom = ast.ImportFrom; _Name = ast.Name
+        source_segment = self._source_segment
+        variables: Dict[str, str] = {}
+        dependencies: List[str] = []
+        add_dependency = dependencies.append
+        child: Any
+        for child in ast.iter_child_nodes(func_node):
+            t = type(child)
+            if t is _Assign:
+                for target in child.targets:
+                    if type(target) is _Name:
+                        variables[target.id] = source_segment(source_lines, child.value)
+            elif t is _Import:
+                for alias in child.names:
+                    add_dependency(alias.name)
+            elif t is _ImportFrom:
+                prefix = (child.module or '') + '.'
+                for alias in child.names:
+                    add_dependency(prefix + alias.name)
+        
+        return FunctionInfo(func_node.name, variables, dependencies, func_node.lineno)
+    
+    def _parse_class(self, class_node: ast.ClassDef, source_lines: List[bytes]) -> ClassInfo:
+        _FunctionDef = ast.FunctionDef; _Assign = ast.Assign; _Import = ast.Import; _ImportFrom = ast.ImportFrom; _Name = ast.Name
+        source_segment = self._source_segment
+        parse_function = self._parse_function
+        methods: Dict[str, FunctionInfo] = {}
+        class_variables: Dict[str, str] = {}
+        dependencies: List[str] = []
+        add_dependency = dependencies.append
+        child: Any
+        for child in ast.iter_child_nodes(class_node):
+            t = type(child)
+            if t is _FunctionDef:
+                methods[child.name] = parse_function(child, source_lines)
+            elif t is _Assign:
+                for target in child.targets:
+                    if type(target) is _Name:
+                        class_variables[target.id] = source_segment(source_lines, child.value)
+            elif t is _Import:
+                for alias in child.names:
+                    add_dependency(alias.name)
+            elif t is _ImportFrom:
+                prefix = (child.module or '') + '.'
+                for alias in child.names:
+                    add_dependency(prefix + alias.name)
+        
+        return ClassInfo(class_node.name, methods, class_variables, dependencies, class_node.lineno)
+    
+    def _add_function(self, node: ast.FunctionDef, file_structure: Dict[str, Any], source_lines: List[bytes]):
+        func_info = self._parse_function(node, source_lines)
+        file_structure['functions'][func_info.name] = func_info
+    
+    def _add_class(self, node: ast.ClassDef, file_structure: Dict[str, Any], source_lines: List[bytes]):
+        class_info = self._parse_class(node, source_lines)
+        file_structure['classes'][class_info.name] = class_info
+    
+    def _add_import(self, node: ast.Import, file_structure: Dict[str, Any], source_lines: List[bytes]):
+        add_dependency = file_structure['dependencies'].append
+        for alias in node.names:
+            add_dependency(alias.name)
+    
+    def _add_import_from(self, node: ast.ImportFrom, file_structure: Dict[str, Any], source_lines: List[bytes]):
+        add_dependency = file_structure['dependencies'].append
+        prefix = (node.module or '') + '.'
+        for alias in node.names:
+            add_dependency(prefix + alias.name)
+    
+    def _cache_path(self, digest: bytes) -> str:
+        key = self._cache_prefix + digest.hex()
+        return os.path.join(self.cache_dir, key + '.json')
+    
+    def _index_path(self, file_path: str) -> str:
+        key = self._cache_prefix + 'path-' + hashlib.blake2b(os.fsencode(file_path), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, key + '.json')
+    
+    def _unchanged_digest(self, file_path: str, mtime_ns: int, size: int) -> Optional[bytes]:
+        record = self._load_cached(self._index_path(file_path))
+        if (type(record) is list and len(record) == 3 and record[0] == mtime_ns
+                and record[1] == size and type(record[2]) is str):
+            try:
+                return bytes.fromhex(record[2])
+            except ValueError:
+                return None
+        return None
+    
+    def _load_structure(self, digest: bytes) -> Optional[Dict[str, Any]]:
+        plain = self._load_cached(self._cache_path(digest))
+        if plain is None:
+            return None
+        try:
+            return _structure_from_plain(plain)
+        except Exception:
+            return None
+    
+    def _load_cached(self, cache_path: str):
+        try:
+            with open(cache_path, 'rb') as f:
+                return _loads(f.read())
+        except Exception:
+            return None
+    
+    def _store_cached(self, cache_path: str, value: Any):
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(value))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def parse_file(self, file_path: str) -> Dict[str, Any]:
+        file_path = os.path.realpath(file_path)
+        stat = os.stat(file_path)
+        return self._parse_file_memoized(file_path, stat.st_mtime_ns, stat.st_size)
+    
+    def _lookup_memo(self, file_path: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+        entry = self._file_memo.get(file_path)
+        if entry is not None and entry[0] == mtime_ns and entry[1] == size:
+            return entry[2]
+        return None
+    
+    def _parse_file_memoized(self, file_path: str, mtime_ns: int, size: int,
+                             unchanged_digest: Optional[bytes] = None) -> Dict[str, Any]:
+        plain = self._lookup_memo(file_path, mtime_ns, size)
+        if plain is not None:
+            return _structure_from_plain(plain)
+        file_structure = self._parse_file_uncached(file_path, mtime_ns, size, unchanged_digest=unchanged_digest)
+        self._file_memo[file_path] = (mtime_ns, size, _structure_to_plain(file_structure))
+        return file_structure
+    
+    def _resolve_unchanged(self, file_path: str, memoize: bool) -> Optional[Tuple[str, int, int, Optional[bytes]]]:
+        real_path = os.path.realpath(file_path)
+        stat = os.stat(real_path)
+        mtime_ns, size = stat.st_mtime_ns, stat.st_size
+        if memoize and self._lookup_memo(real_path, mtime_ns, size) is not None:
+            return real_path, mtime_ns, size, None
+        digest = self._unchanged_digest(real_path, mtime_ns, size)
+        if digest is not None:
+            return real_path, mtime_ns, size, digest
+        return None
+    
+    def _read_file(self, file_path: str) -> Union[bytes, mmap.mmap]:
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            size = os.fstat(fd).st_size
+            if size >= MMAP_THRESHOLD:
+                return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            chunks = []
+            chunk = os.read(fd, size or READ_CHUNK_SIZE)
+            while chunk:
+                chunks.append(chunk)
+                chunk = os.read(fd, READ_CHUNK_SIZE)
+            return b''.join(chunks)
+        finally:
+            os.close(fd)
+    
+    def _parse_file_uncached(self, file_path: str, mtime_ns: Optional[int] = None,
+                             size: Optional[int] = None, memoize: bool = True,
+                             unchanged_digest: Optional[bytes] = None) -> Dict[str, Any]:
+        if mtime_ns is None or size is None:
+            stat = os.stat(file_path)
+            mtime_ns, size = stat.st_mtime_ns, stat.st_size
+        
+        source = self._prefetched.pop(file_path, None)
+        if unchanged_digest is None and source is None:
+            unchanged_digest = self._unchanged_digest(file_path, mtime_ns, size)
+        if unchanged_digest is not None:
+            cached = self._load_structure(unchanged_digest)
+            if cached is not None:
+                return cached
+        
+        if source is None:
+            source = self._read_file(file_path)
+        digest = hashlib.blake2b(source, digest_size=16).digest()
+        if isinstance(source, mmap.mmap):
+            with source:
+                cached = self._load_structure(digest)
+                data = source[:] if cached is None else b''
+        else:
+            cached, data = None, source
+        file_structure = cached if cached is not None else self._parse_source(file_path, digest, data, memoize)
+        self._store_cached(self._index_path(file_path), [mtime_ns, size, digest.hex()])
+        return file_structure
+    
+    def _prefetch(self, file_path: str, memoize: bool) -> Prefetched:
+        real_path = os.path.realpath(file_path)
+        stat = os.stat(real_path)
+        mtime_ns, size = stat.st_mtime_ns, stat.st_size
+        if memoize and self._lookup_memo(real_path, mtime_ns, size) is not None:
+            return real_path, mtime_ns, size, None, None
+        digest = self._unchanged_digest(real_path, mtime_ns, size)
+        if digest is not None:
+            return real_path, mtime_ns, size, None, digest
+        return real_path, mtime_ns, size, self._read_file(real_path), None
+    
+    def _parse_prefetched(self, future: 'Future[Prefetched]', memoize: bool) -> Dict[str, Any]:
+        real_path, mtime_ns, size, data, digest = future.result()
+        if data is not None:
+            self._prefetched[real_path] = data
+        try:
+            if memoize:
+                return self._parse_file_memoized(real_path, mtime_ns, size, digest)
+            return self._parse_file_uncached(real_path, mtime_ns, size, memoize=False, unchanged_digest=digest)
+        finally:
+            unused = self._prefetched.pop(real_path, None)
+            if isinstance(unused, mmap.mmap):
+                unused.close()
+    
+    def _parse_with_prefetch(self, file_paths: List[str], memoize: bool) -> Generator[Dict[str, Any], None, None]:
+        with ThreadPoolExecutor(max_workers=READ_WORKERS) as io_pool:
+            pending: Deque['Future[Prefetched]'] = deque()
+            for file_path in file_paths:
+                pending.append(io_pool.submit(self._prefetch, file_path, memoize))
+                if len(pending) >= READ_AHEAD:
+                    yield self._parse_prefetched(pending.popleft(), memoize)
+            while pending:
+                yield self._parse_prefetched(pending.popleft(), memoize)
+    
+    def _parse_source(self, file_path: str, digest: bytes, data: bytes, memoize: bool) -> Dict[str, Any]:
+        memo = self._source_memo
+        if memoize:
+            plain = memo.get(digest)
+            if plain is not None:
+                return _structure_from_plain(plain)
+        try:
+            file_structure = self._parse_source_uncached(digest, data)
+        except SyntaxError as e:
+            e.filename = file_path
+            raise
+        if memoize:
+            if len(memo) >= SOURCE_MEMO_SIZE:
+                del memo[next(iter(memo))]
+            memo[digest] = _structure_to_plain(file_structure)
+        return file_structure
+    
+    def _parse_source_uncached(self, digest: bytes, data: bytes) -> Dict[str, Any]:
+        cached = self._load_structure(digest)
+        if cached is not None:
+            return cached
+        
+        tree = compile(data, '<unknown>', 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True, optimize=-1)
+        source_lines = data.removeprefix(b'\xef\xbb\xbf').splitlines(keepends=True)
+        
+        file_structure: Dict[str, Any] = {
+            'functions': {},
+            'classes': {},
+            'dependencies': []
+        }
+        
+        dispatch = self._top_dispatch
+        for node in ast.iter_child_nodes(tree):
+            handler = dispatch.get(type(node))
+            if handler is not None:
+                handler(node, file_structure, source_lines)
+        
+        self._store_cached(self._cache_path(digest), _structure_to_plain(file_structure))
+        return file_structure
+    
+    def _iter_parsed(self, max_workers: Optional[int] = None,
+                     memoize: bool = True) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        grouped: Dict[str, Dict[str, str]] = {}
+        for module_name, file, file_path in self._iter_py_files(self.project_path):
+            grouped.setdefault(module_name, {})[file] = file_path
+        items = [(module_name, file, file_path)
+                 for module_name, files in grouped.items()
+                 for file, file_path in files.items()]
+        file_paths = [file_path for _, _, file_path in items]
+        
+        if max_workers == 1 or (os.cpu_count() or 1) == 1 or len(items) < PROCESS_POOL_MIN_FILES:
+            results = self._parse_with_prefetch(file_paths, memoize)
+            for (module_name, file, _), file_structure in zip(items, results):
+                yield module_name, file, file_structure
+            return
+        
+        resolved = [self._resolve_unchanged(file_path, memoize) for file_path in file_paths]
+        misses = [file_path for file_path, hit in zip(file_paths, resolved) if hit is None]
+        if len(misses) < PROCESS_POOL_MIN_FILES:
+            fresh = self._parse_with_prefetch(misses, memoize)
+        else:
+            fresh = self._parse_in_pool(misses, max_workers, memoize)
+        
+        try:
+            for (module_name, file, _), hit in zip(items, resolved):
+                if hit is None:
+                    file_structure = next(fresh)
+                elif memoize:
+                    file_structure = self._parse_file_memoized(*hit)
+                else:
+                    real_path, mtime_ns, size, digest = hit
+                    file_structure = self._parse_file_uncached(real_path, mtime_ns, size, memoize=False,
+                                                               unchanged_digest=digest)
+                yield module_name, file, file_structure
+        finally:
+            fresh.close()
+    
+    def _parse_in_pool(self, file_paths: List[str], max_workers: Optional[int],
+                       memoize: bool) -> Generator[Dict[str, Any], None, None]:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(self.project_path, self.cache_dir, memoize)) as executor:
+            for real_path, mtime_ns, size, plain in executor.map(_parse_file_in_worker, file_paths, chunksize=16):
+                if memoize:
+                    self._file_memo[real_path] = (mtime_ns, size, plain)
+                yield _structure_from_plain(plain)
+    
+    def parse_project(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        for module_name, file, file_structure in self._iter_parsed(max_workers):
+            self.project_structure.setdefault(module_name, {})[file] = file_structure
+        
+        return self.project_structure
+    
+    def save_to_ndjson(self, output_path: str = 'project_ast.ndjson', max_workers: Optional[int] = None):
+
+        with open(output_path, 'wb') as f:
+            for module_name, file, file_structure in self._iter_parsed(max_workers, memoize=False):
+                f.write(_dumps({'module': module_name, 'file': file, 'structure': file_structure}))
+                f.write(b'\n')
+    
+    def stream_to_json(self, output_path: str = 'project_ast.json', max_workers: Optional[int] = None):
+
+        current_module = None
+        with open(output_path, 'wb') as f:
+            f.write(b'{')
+            for module_name, file, file_structure in self._iter_parsed(max_workers, memoize=False):
+                if module_name != current_module:
+                    if current_module is not None:
+                        f.write(b'},')
+                    f.write(_dumps(module_name) + b':{')
+                    current_module = module_name
+                else:
+                    f.write(b',')
+                f.write(_dumps(file) + b':' + _dumps(file_structure))
+            if current_module is not None:
+                f.write(b'}')
+            f.write(b'}')
+    
+    def save_to_json(self, output_path: str = 'project_ast.json', compact: bool = False):
+
+        if orjson is not None:
+            option = 0 if compact else orjson.OPT_INDENT_2
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(self.project_structure, option=option))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                if compact:
+                    json.dump(self.project_structure, f, separators=(',', ':'), default=_as_dict)
+                else:
+                    json.dump(self.project_structure, f, indent=2, default=_as_dict)
+    
+    def save_to_msgpack(self, output_path: str = 'project_ast.msgpack'):
+
+        if msgpack is None:
+            raise ImportError("save_to_msgpack requires the 'msgpack' package")
+        with open(output_path, 'wb') as f:
+            f.write(msgpack.packb(self.project_structure, use_bin_type=True, default=_as_dict))
+    
+    def load_from_msgpack(self, input_path: str = 'project_ast.msgpack') -> Dict[str, Any]:
+
+        if msgpack is None:
+            raise ImportError("load_from_msgpack requires the 'msgpack' package")
+        with open(input_path, 'rb') as f:
+            self.project_structure = msgpack.unpackb(f.read(), raw=False)
+        return self.project_structure
+
+_worker_parser: Optional[PythonProjectParser] = None
+
+_worker_memoize = True
+
+def _init_worker(project_path: str, cache_dir: str, memoize: bool = True):
+    global _worker_parser, _worker_memoize
+    _worker_parser = PythonProjectParser(project_path, cache_dir)
+    _worker_memoize = memoize
+
+def _parse_file_in_worker(file_path: str) -> Tuple[str, int, int, Dict[str, Any]]:
+    assert _worker_parser is not None
+    real_path = os.path.realpath(file_path)
+    stat = os.stat(real_path)
+    file_structure = _worker_parser._parse_file_uncached(real_path, stat.st_mtime_ns, stat.st_size, _worker_memoize)
+    return real_path, stat.st_mtime_ns, stat.st_size, _structure_to_plain(file_structure)
+
+def _default_cache_dir() -> str:
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'ast_project')
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), default=_as_dict).encode('utf-8')
+
+def _function_to_plain(info: FunctionInfo) -> Dict[str, Any]:
+    return {'name': info.name, 'variables': dict(info.variables),
+            'dependencies': list(info.dependencies), 'line_number': info.line_number}
+
+def _function_from_plain(plain: Dict[str, Any]) -> FunctionInfo:
+    return FunctionInfo(plain['name'], dict(plain['variables']),
+                        list(plain['dependencies']), plain['line_number'])
+
+def _structure_to_plain(file_structure: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'functions': {name: _function_to_plain(info) for name, info in file_structure['functions'].items()},
+        'classes': {name: {'name': info.name,
+                           'methods': {m: _function_to_plain(method) for m, method in info.methods.items()},
+                           'variables': dict(info.variables),
+                           'dependencies': list(info.dependencies),
+                           'line_number': info.line_number}
+                    for name, info in file_structure['classes'].items()},
+        'dependencies': list(file_structure['dependencies'])
+    }
+
+def _structure_from_plain(plain: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'functions': {name: _function_from_plain(info) for name, info in plain['functions'].items()},
+        'classes': {name: ClassInfo(info['name'],
+                                    {m: _function_from_plain(method) for m, method in info['methods'].items()},
+                                    dict(info['variables']),
+                                    list(info['dependencies']),
+                                    info['line_number'])
+                    for name, info in plain['classes'].items()},
+        'dependencies': list(plain['dependencies'])
+    }
+
+def _as_dict(obj: Any) -> Dict[str, Any]:
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+def main(project_path: str, output_path: str = 'project_ast.json'):
+ 
+    parser = PythonProjectParser(project_path)
+    if output_path.endswith('.ndjson'):
+        parser.save_to_ndjson(output_path)
+    else:
+        parser.parse_project()
+        if output_path.endswith('.msgpack'):
+            parser.save_to_msgpack(output_path)
+        else:
+            parser.save_to_json(output_path)
+    print(f"Project AST parsed and saved to {output_path}")
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) < 2:
+        print("Usage: python script.py <project_path> [output_path]")
+        sys.exit(1)
+    
+    project_path = sys.argv[1]
+    output_path = sys.argv[2] if len(sys.argv) > 2 else 'project_ast.json'
+    main(project_path, output_path)